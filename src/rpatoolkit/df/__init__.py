@@ -1,2 +1,7 @@
-from .normalize_columns import denormalize_columns, normalize_columns
+from .normalize_columns import (
+    CompiledMapping,
+    compile_mapping,
+    denormalize_columns,
+    normalize_columns,
+)
 from .utils import get_missing_columns, reorder_columns, safe_schema_override
@@ -3,17 +3,25 @@ import polars as pl
 from rpatoolkit.utils import strip_punctuation
 
 
-def normalize_columns(
-    df: pl.DataFrame,
-    mapping: dict[str, list[str] | str],
-):
+def _clean_column_name(name: str) -> str:
     """
-    Normalize and rename columns of a polars dataframe based on column mapping
+    Lowercase and strip punctuation from a column name.
+    """
+    return strip_punctuation(name.lower())
+
+
+class CompiledMapping(dict[str, str]):
+    """
+    Reverse lookup of cleaned possible column names to standard column names. Built by compile_mapping().
+    """
+
+
+def compile_mapping(mapping: dict[str, list[str] | str]) -> CompiledMapping:
+    """
+    Compile a column mapping into a reverse lookup that can be reused across normalize_columns() calls
 
     Parameters
     ----------
-    df : pl.DataFrame
-        Polars dataframe
     mapping : dict[str, list[str]  |  str]
         dict where keys are standard column names and values are either
         - a list of possible column names
@@ -21,30 +29,33 @@ def normalize_columns(
 
     Returns
     -------
-    tuple[pl.DataFrame, dict[str, str]]
-        A tuple containing the normalized dataframe and a dictionary mapping original column names to standardized column names to be used for denormalizing columns.
+    CompiledMapping
+        Reverse lookup of cleaned possible column names to standard column names
 
     Raises
     ------
     ValueError
         If different possible names in two different standard names, map to the same standard name.
-    ValueError
-        If multiple columns map to the same standard name.
-    """
-
-    if not mapping:
-        return df
 
+    Example
+    -------
+    >>> mapping = compile_mapping({"full_name": ["name", "first name"]})
+    >>> for df in dataframes:
+    ...     df, restore_map = normalize_columns(df, mapping)
+    """
     # Build a reverse mapping for O(1) lookup of possible column names to standard column name
-    reverse_lookup = {}
+    reverse_lookup = CompiledMapping()
     for standard_name, possible_names in mapping.items():
         if isinstance(possible_names, str):
             possible_names = [possible_names]
 
         for name in possible_names:
-            clean_key = strip_punctuation(name.strip().lower())
+            clean_key = _clean_column_name(name)
 
-            if clean_key in reverse_lookup:
+            if (
+                clean_key in reverse_lookup
+                and reverse_lookup[clean_key] != standard_name
+            ):
                 raise ValueError(
                     f"Ambiguous mapping: '{name}' maps to both "
                     f"'{reverse_lookup[clean_key]}' and '{standard_name}'"
@@ -52,6 +63,48 @@ def normalize_columns(
 
             reverse_lookup[clean_key] = standard_name
 
+    return reverse_lookup
+
+
+def normalize_columns(
+    df: pl.DataFrame,
+    mapping: dict[str, list[str] | str] | CompiledMapping,
+) -> tuple[pl.DataFrame, dict[str, str]]:
+    """
+    Normalize and rename columns of a polars dataframe based on column mapping
+
+    Parameters
+    ----------
+    df : pl.DataFrame
+        Polars dataframe
+    mapping : dict[str, list[str]  |  str] | CompiledMapping
+        dict where keys are standard column names and values are either
+        - a list of possible column names
+        - a single column name (string)
+
+        Or a mapping compiled with compile_mapping(), to skip rebuilding the lookup when the same mapping is used for many dataframes.
+
+    Returns
+    -------
+    tuple[pl.DataFrame, dict[str, str]]
+        A tuple containing the normalized dataframe and a dictionary mapping original column names to standardized column names to be used for denormalizing columns.
+
+    Raises
+    ------
+    ValueError
+        If different possible names in two different standard names, map to the same standard name.
+    ValueError
+        If multiple columns map to the same standard name.
+    """
+
+    if not mapping:
+        return df, {}
+
+    if isinstance(mapping, CompiledMapping):
+        reverse_lookup = mapping
+    else:
+        reverse_lookup = compile_mapping(mapping)
+
     # Get original column names
     original_cols = df.columns
 
@@ -61,7 +114,7 @@ def normalize_columns(
     used_final_names = set()
 
     for orig_col in original_cols:
-        temp_col = strip_punctuation(orig_col.strip().lower())
+        temp_col = _clean_column_name(orig_col)
         final_name = reverse_lookup.get(temp_col, temp_col)
 
         if final_name in used_final_names:
@@ -5,8 +5,18 @@ import polars as pl
 log = logging.getLogger(__name__)
 
 
+def _get_column_names(df: pl.DataFrame | pl.LazyFrame) -> list[str]:
+    if isinstance(df, pl.LazyFrame):
+        return df.collect_schema().names()
+
+    return df.columns
+
+
 def reorder_columns(
-    df: pl.DataFrame | pl.LazyFrame, columns_order: list[str]
+    df: pl.DataFrame | pl.LazyFrame,
+    columns_order: list[str],
+    *,
+    columns: list[str] | None = None,
 ) -> pl.DataFrame | pl.LazyFrame:
     """
     Reorder columns of a Polars DataFrame or LazyFrame.
@@ -14,6 +24,7 @@ def reorder_columns(
     Args:
         df (pl.DataFrame | pl.LazyFrame): The input DataFrame or LazyFrame.
         columns_order (list[str]): A list specifying the desired order of columns or subset of columns that you want to be ordered.
+        columns (list[str] | None, optional): Column names of df if already known. Avoids resolving the LazyFrame schema again. Defaults to None.
 
     Returns:
         pl.DataFrame | pl.LazyFrame: The DataFrame or LazyFrame with reordered columns.
@@ -40,18 +51,21 @@ def reorder_columns(
 
     """
     # Select the specified columns in the desired order, then append any remaining columns
-    if isinstance(df, pl.LazyFrame):
-        df_cols = df.collect_schema().names()
-    else:
-        df_cols = df.columns
+    df_cols = columns if columns is not None else _get_column_names(df)
+
+    available_cols = set(df_cols)
+    ordered_cols = set(columns_order)
 
-    selected_cols = [pl.col(col) for col in columns_order if col in df_cols]
-    remaining_cols = [pl.col(col) for col in df_cols if col not in columns_order]
+    selected_cols = [col for col in columns_order if col in available_cols]
+    remaining_cols = [col for col in df_cols if col not in ordered_cols]
     return df.select(selected_cols + remaining_cols)
 
 
 def get_missing_columns(
-    df: pl.DataFrame | pl.LazyFrame, required_columns: list[str]
+    df: pl.DataFrame | pl.LazyFrame,
+    required_columns: list[str],
+    *,
+    columns: list[str] | None = None,
 ) -> list[str]:
     """
     Check if a Polars DataFrame or LazyFrame contains all required columns and return a list of missing columns.
@@ -59,6 +73,7 @@ def get_missing_columns(
     Args:
         df (pl.DataFrame | pl.LazyFrame): The input DataFrame or LazyFrame.
         required_columns (list[str]): A list of required column names.
+        columns (list[str] | None, optional): Column names of df if already known. Avoids resolving the LazyFrame schema again. Defaults to None.
 
     Returns:
         list
@@ -76,10 +91,8 @@ def get_missing_columns(
         ['E']
     """
 
-    if isinstance(df, pl.LazyFrame):
-        available_columns = [col.lower() for col in df.collect_schema().names()]
-    else:
-        available_columns = [col.lower() for col in df.columns]
+    df_cols = columns if columns is not None else _get_column_names(df)
+    available_columns = {col.lower() for col in df_cols}
 
     missing_cols = [
         col for col in required_columns if col.lower() not in available_columns
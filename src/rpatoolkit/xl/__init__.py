@@ -1,5 +1,11 @@
 from .read_sheet import read_sheet
-from .helpers import get_sheet_names, read_visible_rows, locate_header_row
+from .helpers import (
+    get_sheet_names,
+    read_visible_rows,
+    locate_header_row,
+    locate_header_rows,
+    clear_header_row_cache,
+)
 from .read_multiple_sheets import read_multiple_sheets
 from .convert_to_html import convert_to_html
 from .format import apply_borders
@@ -1,4 +1,8 @@
 import logging
+import os
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from typing import Any, TypedDict
 
 import polars as pl
@@ -24,7 +28,7 @@ def get_sheet_names(
     Parameters
     ----------
     source : Any
-        Path or file-like object to read
+        Path, file-like object or an already opened CalamineWorkbook to read
     visible_only : bool, optional
         Whether to only include visible sheets, by default False
 
@@ -33,10 +37,14 @@ def get_sheet_names(
     list[str]
         List of sheet names
     """
-    if hasattr(source, "seek"):
-        source.seek(0)
+    if isinstance(source, CalamineWorkbook):
+        sheets_meta = source.sheets_metadata
+    else:
+        if hasattr(source, "seek"):
+            source.seek(0)
 
-    sheets_meta = CalamineWorkbook.from_object(source).sheets_metadata
+        with CalamineWorkbook.from_object(source) as wb:
+            sheets_meta = wb.sheets_metadata
 
     result: list[str] = []
     for meta in sheets_meta:
@@ -85,6 +93,25 @@ def read_visible_rows(
     ValueError
         header_row index is out of boundsf
     """
+    df, _ = _read_visible_rows(
+        source,
+        sheet_name=sheet_name,
+        header_row=header_row,
+        strip_values=strip_values,
+        strip_headers=strip_headers,
+    )
+    return df
+
+
+def _read_visible_rows(
+    source: Any,
+    *,
+    sheet_name: str | None,
+    header_row: int | None,
+    strip_values: bool,
+    strip_headers: bool,
+) -> tuple[pl.DataFrame, set[str]]:
+    # Also returns the names of the columns without a header cell, read_sheet drops those when they are empty
     if hasattr(source, "seek"):
         source.seek(0)
 
@@ -98,18 +125,20 @@ def read_visible_rows(
     else:
         ws = wb[wb.sheetnames[0]]
 
+    # Collect hidden rows once, indexing row_dimensions per row creates a RowDimension for every row
+    hidden_rows = {
+        row_idx for row_idx, dimension in ws.row_dimensions.items() if dimension.hidden
+    }
+
     visible_rows = []
-    for row in ws.iter_rows():
-        row_idx = row[0].row
-        is_row_hidden = ws.row_dimensions[row_idx].hidden
-        if is_row_hidden:
+    for row_idx, row in enumerate(ws.iter_rows(values_only=True), start=1):
+        if row_idx in hidden_rows:
             continue
 
         # Get row values
         row_values = []
-        for cell in row:
-            val = cell.value
-            if isinstance(cell.value, str) and strip_values:
+        for val in row:
+            if isinstance(val, str) and strip_values:
                 val = val.strip() or None
 
             row_values.append(val)
@@ -119,7 +148,7 @@ def read_visible_rows(
     wb.close()
 
     if not visible_rows:
-        return pl.DataFrame()
+        return pl.DataFrame(), set()
 
     idx = header_row if header_row is not None else 0
     if idx >= len(visible_rows):
@@ -130,9 +159,11 @@ def read_visible_rows(
 
     # Handle default column names
     cleaned_headers = []
+    headerless = []
     for i, header in enumerate(headers):
         if header is None:
             header = f"column_{i}"
+            headerless.append(i)
 
         header = str(header).strip() if header and strip_headers else str(header)
         cleaned_headers.append(header)
@@ -146,25 +177,34 @@ def read_visible_rows(
         else:
             seen[header] = 0
 
+    headerless_cols = {cleaned_headers[i] for i in headerless}
+
     # Remove empty rows
-    cleaned_data = []
-    for row in data:
-        if not all(
-            cell is None or (isinstance(cell, str) and cell.strip() == "")
-            for cell in row
-        ):
-            cleaned_data.append(row)
+    if strip_values:
+        # Blank strings were already converted to None, so a row is empty if all its cells are None
+        cleaned_data = [row for row in data if row.count(None) < len(row)]
+    else:
+        cleaned_data = []
+        for row in data:
+            if not all(
+                cell is None or (isinstance(cell, str) and cell.strip() == "")
+                for cell in row
+            ):
+                cleaned_data.append(row)
 
     if not cleaned_data:
-        return pl.DataFrame(schema=cleaned_headers, strict=False, orient="row")
+        return pl.DataFrame(
+            schema=cleaned_headers, strict=False, orient="row"
+        ), headerless_cols
 
-    return pl.DataFrame(
+    df = pl.DataFrame(
         cleaned_data,
         schema=cleaned_headers,
         strict=False,
         orient="row",
         infer_schema_length=len(cleaned_data),
     )
+    return df, headerless_cols
 
 
 def locate_header_row(
@@ -181,7 +221,7 @@ def locate_header_row(
     Parameters
     ----------
     source : Any
-        Path or file-like object to read
+        Path, file-like object or an already opened CalamineWorkbook to read. Pass a workbook to scan several sheets without parsing the file again.
     sheet_id : int | None, optional
         0-based index of the sheet to read, by default None (Cannot be used with sheet_name)
     sheet_name : str | None, optional
@@ -196,7 +236,7 @@ def locate_header_row(
     int
         Zero-based index of the first row with maximum consecutive non-null values.
 
-        If expected_keywords is provided, this is the first row with all expected keywords and maximum consecutive non-null values.
+        If expected_keywords is provided, this is the first row with all expected keywords. Falls back to the row with maximum consecutive non-null values if no row contains all of them.
 
     Raises
     ------
@@ -208,57 +248,187 @@ def locate_header_row(
     - If first few rows are empty and the first non-empty row is the header, then simply use read_excel_sheet() or pl.read_excel() directly instead of finding the header row.
 
     - This function would be best suited when you want to read a filtered excel sheet using read_excel_sheet(visible_rows_only=True, header_row=header_row). OR If the header row is not the first non-empty row.
+
+    - Results for file paths are cached by path, modification time and size, so scanning an unchanged file again is a lookup. Use clear_header_row_cache() to drop the cache.
     """
-    if sheet_id and sheet_name:
+    if sheet_id is not None and sheet_name:
         raise ValueError("sheet_id and sheet_name cannot be both specified.")
 
+    opts = {
+        "sheet_id": sheet_id,
+        "sheet_name": sheet_name,
+        "max_rows": max_rows,
+        "expected_keywords": expected_keywords,
+    }
+    if isinstance(source, CalamineWorkbook):
+        return _locate_header_row(source, **opts)
+
+    if isinstance(source, (str, os.PathLike)):
+        path = os.path.abspath(source)
+        stat = os.stat(path)
+        # Cache keys must be hashable, an empty list means no keywords like on the other sources
+        opts["expected_keywords"] = (
+            tuple(expected_keywords) if expected_keywords else None
+        )
+
+        return _locate_header_row_in_file(path, stat.st_mtime_ns, stat.st_size, **opts)
+
     if hasattr(source, "seek"):
         source.seek(0)
 
-    wb = CalamineWorkbook.from_object(source)
-    if sheet_id:
-        ws = wb.get_sheet_by_index(0)
+    # Close the workbook once scanned, so the file is not left open (and locked on Windows)
+    with CalamineWorkbook.from_object(source) as wb:
+        return _locate_header_row(wb, **opts)
+
+
+@lru_cache(maxsize=256)
+def _locate_header_row_in_file(
+    path: str,
+    mtime_ns: int,
+    size: int,
+    *,
+    sheet_id: int | None,
+    sheet_name: str | None,
+    max_rows: int,
+    expected_keywords: tuple[str, ...] | None,
+) -> int:
+    # mtime_ns and size are only part of the cache key, so a modified file is scanned again
+    with CalamineWorkbook.from_path(path) as wb:
+        return _locate_header_row(
+            wb,
+            sheet_id=sheet_id,
+            sheet_name=sheet_name,
+            max_rows=max_rows,
+            expected_keywords=expected_keywords,
+        )
+
+
+def clear_header_row_cache() -> None:
+    """
+    Clears the cached header rows of files scanned by locate_header_row()
+    """
+    _locate_header_row_in_file.cache_clear()
+
+
+def _locate_header_row(
+    wb: CalamineWorkbook,
+    *,
+    sheet_id: int | None,
+    sheet_name: str | None,
+    max_rows: int,
+    expected_keywords: Sequence[str] | None,
+) -> int:
+    if sheet_id is not None:
+        ws = wb.get_sheet_by_index(sheet_id)
     elif sheet_name:
         ws = wb.get_sheet_by_name(sheet_name)
     else:
         ws = wb.get_sheet_by_index(0)
 
+    keywords = (
+        frozenset(keyword.lower() for keyword in expected_keywords)
+        if expected_keywords
+        else None
+    )
+
+    # Fetch the rows to scan in a single call instead of one call per row. Rows above the
+    # used area of the sheet are empty and can never be the header row, so start from there.
+    start_row = ws.start[0] if ws.start else max_rows
+    rows = ws.to_python(nrows=max_rows - start_row) if start_row < max_rows else []
+
     max_consecutive = 0
     header_row = 0
-    for i, row in enumerate(ws.iter_rows()):
-        if i > max_rows:
-            log.debug("Reached max_rows limit")
-            break
-
+    for i, row in enumerate(rows, start=start_row):
         consecutive_count = 0
-        is_all_keywords_present = False
-
-        if expected_keywords:
-            # If expected keywords are provided, check if all of them are present in the row
-            row_values = [str(value).strip().lower() for value in row if value]
+        is_consecutive = True
+        found_keywords = set()
 
-            is_all_keywords_present = all(
-                keyword.lower() in row_values for keyword in expected_keywords
-            )
-
-        # Check for non-null consecutive values
+        # Count leading non-null consecutive values and match keywords in a single pass
         for value in row:
-            if value:
-                consecutive_count += 1
+            # Only strings can be blank, numbers, booleans and dates (including 0 and False) are always values
+            if isinstance(value, str):
+                value = value.strip()
+                is_empty = not value
             else:
-                break
+                is_empty = value is None
+
+            if not is_empty:
+                if is_consecutive:
+                    consecutive_count += 1
+                if keywords:
+                    value = str(value).lower()
+                    if value in keywords:
+                        found_keywords.add(value)
+                        if len(found_keywords) == len(keywords):
+                            # All keywords found, no need to look at the rest of the row
+                            break
+            else:
+                is_consecutive = False
+                if not keywords:
+                    break
+
+        if keywords and len(found_keywords) == len(keywords):
+            # This is the first row with all expected keywords, so its most likely the header row
+            log.info(
+                f"Found first header row at index: '{i}' with all expected keywords"
+            )
+            return i
 
         if consecutive_count > max_consecutive:
             max_consecutive = consecutive_count
             header_row = i
-            if expected_keywords and is_all_keywords_present:
-                # This is the first row with all expected keywords, and highest consecutive non-null count, so its most likely the header row
-                log.info(
-                    f"Found first header row at index: '{i}' with all expected keywords and maximum consecutive non-null values"
-                )
+            if not keywords and consecutive_count == len(row):
+                # Every cell of the row is filled, no later row can have more consecutive values
                 break
 
     log.info(
         f"Identified header row at index: {header_row} with {max_consecutive} consecutive non-null values"
     )
     return header_row
+
+
+def locate_header_rows(
+    sources: list[Any],
+    *,
+    sheet_id: int | None = None,
+    sheet_name: str | None = None,
+    max_rows: int = 200,
+    expected_keywords: list[str] | None = None,
+    max_workers: int | None = None,
+) -> list[int]:
+    """
+    Finds the header row of several excel files concurrently. See locate_header_row() for how the header row is identified.
+
+    Parameters
+    ----------
+    sources : list[Any]
+        Paths or file-like objects to read
+    sheet_id : int | None, optional
+        0-based index of the sheet to read in every file, by default None (Cannot be used with sheet_name)
+    sheet_name : str | None, optional
+        Name of the worksheet to read in every file, by default None (Cannot be used with sheet_id)
+    max_rows : int, optional
+        Maximum number of rows to scan for header identification, by default 200
+    expected_keywords : list[str] | None, optional
+        List of keywords to look for in the header row, by default None
+    max_workers : int | None, optional
+        Maximum number of worker threads, by default None (number of CPUs)
+
+    Returns
+    -------
+    list[int]
+        Zero-based index of the header row of each source, in the same order as sources
+
+    Notes
+    -----
+    - Each source is opened in its own thread with its own CalamineWorkbook, workbook handles are not shared between threads. Do not pass the same file-like object twice.
+    """
+    locate = partial(
+        locate_header_row,
+        sheet_id=sheet_id,
+        sheet_name=sheet_name,
+        max_rows=max_rows,
+        expected_keywords=expected_keywords,
+    )
+    with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        return list(executor.map(locate, sources))
@@ -1,6 +1,7 @@
 from typing import Any
 
 import polars as pl
+from python_calamine import CalamineWorkbook
 
 from rpatoolkit.df import safe_schema_override
 from rpatoolkit.utils import strip_punctuation
@@ -54,17 +55,23 @@ def read_multiple_sheets(
         Dictionary mapping sheet names to their corresponding DataFrame
     """
 
-    if visible_sheets_only:
-        sheet_names = get_sheet_names(source, visible_only=True)
-    else:
-        sheet_names = get_sheet_names(source)
+    if hasattr(source, "seek"):
+        source.seek(0)
 
-    all_df = _read_all_sheets_to_df(
-        source,
-        sheet_names=sheet_names,
-        find_header_row=find_header_row,
-        find_header_row_opts=find_header_row_opts,
-    )
+    # Parse the workbook once for the sheet names and the header row of every sheet
+    with CalamineWorkbook.from_object(source) as wb:
+        if visible_sheets_only:
+            sheet_names = get_sheet_names(wb, visible_only=True)
+        else:
+            sheet_names = get_sheet_names(wb)
+
+        all_df = _read_all_sheets_to_df(
+            source,
+            wb=wb,
+            sheet_names=sheet_names,
+            find_header_row=find_header_row,
+            find_header_row_opts=find_header_row_opts,
+        )
 
     result_df = _format_df(
         all_df,
@@ -87,10 +94,12 @@ def _format_df(
 ):
     result_df: dict[str, pl.DataFrame] = {}
     for sheet_name, df in all_df.items():
-        if lower_column_names:
+        if lower_column_names and clean_column_names:
+            # Single pass, strip_punctuation also strips surrounding whitespace
+            df.columns = [strip_punctuation(col.lower()) for col in df.columns]
+        elif lower_column_names:
             df.columns = [col.strip().lower() for col in df.columns]
-
-        if clean_column_names:
+        elif clean_column_names:
             df.columns = [strip_punctuation(col) for col in df.columns]
 
         if schema_overrides:
@@ -109,6 +118,7 @@ def _format_df(
 def _read_all_sheets_to_df(
     source: Any,
     *,
+    wb: CalamineWorkbook,
     sheet_names: list[str],
     find_header_row: bool = False,
     find_header_row_opts: dict[str, FindHeaderRowOptions] | None = None,
@@ -118,10 +128,8 @@ def _read_all_sheets_to_df(
 
     all_df: dict[str, pl.DataFrame] = {}
     for sheet in sheet_names:
-        header_row = None
-        if find_header_row:
-            opts = find_header_row_opts.get(sheet, {}) if find_header_row_opts else {}
-            header_row = locate_header_row(source, **opts)
+        opts = find_header_row_opts.get(sheet, {}) if find_header_row_opts else {}
+        header_row = locate_header_row(wb, sheet_name=sheet, **opts)
 
         all_df[sheet] = pl.read_excel(
             source,
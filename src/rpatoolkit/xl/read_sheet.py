@@ -1,14 +1,15 @@
 from typing import Any
 
 import polars as pl
+from python_calamine import CalamineWorkbook
 
 from rpatoolkit.df import safe_schema_override
 from rpatoolkit.utils import strip_punctuation
 from rpatoolkit.xl.helpers import (
     FindHeaderRowOptions,
+    _read_visible_rows,
     get_sheet_names,
     locate_header_row,
-    read_visible_rows,
 )
 
 
@@ -19,6 +20,7 @@ def read_sheet(
     find_header_row: bool = False,
     find_header_row_opts: FindHeaderRowOptions | None = None,
     header_row: int | None = None,
+    columns: list[int] | list[str] | str | None = None,
     first_visbile_sheet: bool = False,
     visible_rows_only: bool = False,
     lower_column_names: bool = True,
@@ -44,6 +46,8 @@ def read_sheet(
         Options for finding the header row, by default None
     header_row : int, optional
         Row number to use as header (0-indexed). This overrides find_header_row, by default None
+    columns : list[int] | list[str] | str | None, optional
+        Column indices or names to read. Passed to the excel reader so only these columns are parsed, by default None (all columns)
     first_visbile_sheet : bool, optional
         Whether to read the first visible sheet. This skips the sheets that are hidden in the workbook and reads, by default False
     visible_rows_only : bool, optional
@@ -59,9 +63,16 @@ def read_sheet(
     raise_if_empty : bool, optional
         Raise an exception if the resulting sheet is empty, by default True
     drop_empty_rows : bool, optional
-        Remove empty rows from the sheet, by default False
+        Remove empty rows from the sheet, by default True
     drop_empty_cols : bool, optional
-        Remove empty columns from the sheet, by default False
+        Remove empty columns from the sheet, by default True
+
+    Raises
+    ------
+    TypeError
+        If columns mixes column indices and column names
+    ValueError
+        If raise_if_empty is True and no rows are found in the sheet
 
     Note:
     -----
@@ -71,30 +82,61 @@ def read_sheet(
         # header_row overrides find_header_row, no need to find header row if header_row is specified
         find_header_row = False
 
-    if find_header_row:
-        header_row = locate_header_row(
-            source,
-            sheet_name=sheet_name,
-            **find_header_row_opts if find_header_row_opts else {},
-        )
+    if isinstance(columns, str):
+        columns = [columns]
+
+    if columns and len({isinstance(col, int) for col in columns}) > 1:
+        raise TypeError("columns must be either all indices or all names, not both")
 
-    if first_visbile_sheet:
-        visible_sheets = get_sheet_names(source, visible_only=True)
-        if visible_sheets:
-            sheet_name = visible_sheets[0]
+    if find_header_row or first_visbile_sheet:
+        # Open the workbook once for both the sheet lookup and the header row scan
+        if hasattr(source, "seek"):
+            source.seek(0)
+
+        with CalamineWorkbook.from_object(source) as wb:
+            if first_visbile_sheet:
+                visible_sheets = get_sheet_names(wb, visible_only=True)
+                if visible_sheets:
+                    sheet_name = visible_sheets[0]
+
+            if find_header_row:
+                header_row = locate_header_row(
+                    wb,
+                    sheet_name=sheet_name,
+                    **find_header_row_opts if find_header_row_opts else {},
+                )
 
     if visible_rows_only:
-        df = read_visible_rows(
+        df, headerless_cols = _read_visible_rows(
             source,
             sheet_name=sheet_name,
             header_row=header_row,
+            strip_values=True,
+            strip_headers=True,
         )
+        empty_cols = set()
+        if drop_empty_cols and df.height and headerless_cols:
+            # Like pl.read_excel, only drop empty columns without a header cell
+            null_counts = df.null_count().row(0)
+            empty_cols = {
+                col
+                for col, count in zip(df.columns, null_counts)
+                if count == df.height and col in headerless_cols
+            }
+
+        if columns:
+            # An empty list reads all columns, like pl.read_excel
+            df = df.select(pl.nth(columns) if isinstance(columns[0], int) else columns)
+
+        if empty_cols:
+            df = df.select(col for col in df.columns if col not in empty_cols)
     else:
         read_options = {"header_row": header_row} if header_row else None
         df = pl.read_excel(
             source,
             sheet_name=sheet_name,
             read_options=read_options,
+            columns=columns,
             drop_empty_cols=drop_empty_cols,
             drop_empty_rows=drop_empty_rows,
         )
@@ -102,10 +144,12 @@ def read_sheet(
     if raise_if_empty and df.height == 0:
         raise ValueError(f"No rows found in the sheet: '{sheet_name or 'Default'}'")
 
-    if lower_column_names:
+    if lower_column_names and clean_column_names:
+        # Single pass, strip_punctuation also strips surrounding whitespace
+        df.columns = [strip_punctuation(col.lower()) for col in df.columns]
+    elif lower_column_names:
         df.columns = [col.strip().lower() for col in df.columns]
-
-    if clean_column_names:
+    elif clean_column_names:
         df.columns = [strip_punctuation(col) for col in df.columns]
 
     if schema_overrides:
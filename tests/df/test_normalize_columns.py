@@ -1,6 +1,6 @@
 import pytest
 import polars as pl
-from rpatoolkit.df import normalize_columns
+from rpatoolkit.df import compile_mapping, normalize_columns
 
 
 def test_normalize_columns_basic():
@@ -152,10 +152,10 @@ def test_normalize_columns_empty_mapping():
 
     mapping = {}
 
-    result = normalize_columns(df, mapping)
+    result, restore_map = normalize_columns(df, mapping)
 
-    assert result.columns == df.columns
-    assert result.shape == df.shape
+    assert result is df
+    assert restore_map == {}
 
 
 def test_normalize_columns_complex_normalization():
@@ -174,3 +174,33 @@ def test_normalize_columns_complex_normalization():
     expected_columns = ["full_name", "years_old", "location"]
 
     assert result.columns == expected_columns
+
+
+def test_normalize_columns_compiled_mapping():
+    """Test that a compiled mapping gives the same result as the raw mapping."""
+    df = pl.DataFrame({"Name?": ["Alice", "Bob"], "AGE": [25, 30]})
+
+    mapping = {"full_name": ["name"], "years_old": "age"}
+    compiled = compile_mapping(mapping)
+
+    result, restore_map = normalize_columns(df, compiled)
+    expected, expected_restore_map = normalize_columns(df, mapping)
+
+    assert result.columns == expected.columns == ["full_name", "years_old"]
+    assert restore_map == expected_restore_map
+
+
+def test_compile_mapping_duplicate_mapping_error():
+    with pytest.raises(ValueError, match="Ambiguous mapping"):
+        compile_mapping({"full_name": ["name"], "person_name": ["name"]})
+
+
+def test_normalize_columns_equivalent_names_for_same_standard_name():
+    """Test that possible names which clean to the same key are allowed for one standard name."""
+    df = pl.DataFrame({"First Name": ["Alice", "Bob"], "age": [25, 30]})
+
+    mapping = {"full_name": ["First Name", "first name", "first-name!"]}
+
+    result, _ = normalize_columns(df, mapping)
+
+    assert result.columns == ["full_name", "age"]
@@ -0,0 +1,22 @@
+import polars as pl
+
+from rpatoolkit.df import get_missing_columns, reorder_columns
+
+
+def test_reorder_columns_lazyframe_with_known_columns():
+    lf = pl.LazyFrame({"A": [1], "B": [2], "C": [3]})
+
+    result = reorder_columns(lf, ["C", "A"], columns=lf.collect_schema().names())
+
+    assert isinstance(result, pl.LazyFrame)
+    assert result.collect_schema().names() == ["C", "A", "B"]
+
+
+def test_get_missing_columns_lazyframe_with_known_columns():
+    lf = pl.LazyFrame({"A": [1], "B": [2]})
+
+    result = get_missing_columns(
+        lf, ["a", "C", "B"], columns=lf.collect_schema().names()
+    )
+
+    assert result == ["C"]
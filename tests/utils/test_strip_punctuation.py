@@ -78,6 +78,11 @@ class TestStripPunctuation:
         with pytest.raises(TypeError, match="Input must be a string"):
             strip_punctuation({})
 
+    @pytest.mark.parametrize("replacement", [None, 5, b"_"])
+    def test_non_string_replacement_type_error(self, replacement):
+        with pytest.raises(TypeError, match="Replacement must be a string"):
+            strip_punctuation("a!b", replacement)
+
     def test_underscores_unchanged(self):
         result = strip_punctuation("hello_world_test")
         assert result == "hello_world_test"
@@ -92,3 +97,8 @@ class TestStripPunctuation:
         expected = "Hello World This is a test 123456789domaincom"
         result = strip_punctuation(input_str)
         assert result == expected
+
+    @pytest.mark.parametrize("replacement", ["", "_", "-", "--", "\\", "\\n", "\\1"])
+    def test_replacement_is_literal_for_ascii_and_non_ascii(self, replacement):
+        assert strip_punctuation("a!b", replacement) == f"a{replacement}b"
+        assert strip_punctuation("é!b", replacement) == f"é{replacement}b"
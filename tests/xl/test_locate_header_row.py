@@ -1,76 +1,176 @@
-import os
-import tempfile
+import io
 
 import polars as pl
+import pytest
+from openpyxl import Workbook as OpenpyxlWorkbook
+from xlsxwriter import Workbook
 
-from rpatoolkit.xl import locate_header_row
+from rpatoolkit.xl import clear_header_row_cache, locate_header_row, locate_header_rows
+from rpatoolkit.xl.helpers import _locate_header_row_in_file
 
+HEADERS_AT_TOP = pl.DataFrame(
+    {
+        "Name": ["John", "Jane", "Bob"],
+        "Age": [25, 30, 35],
+        "City": ["NYC", "LA", "Chicago"],
+    }
+)
 
-def test_locate_header_row_at_beginning():
-    """Test finding header row when headers are at the beginning"""
-    # Create a test dataframe with headers at row 0
-    df = pl.DataFrame(
+OFFSET_HEADERS = pl.DataFrame(
+    {
+        "Name": ["Non Null", None, "Name", "Jane", "Bob"],
+        "Age": [None, None, "Age", 30, 35],
+        "City": [None, None, "City", "LA", "Chicago"],
+    },
+    strict=False,
+)
+
+OFFSET_HEADERS_WITH_BLANK_ROWS = pl.DataFrame(
+    {
+        "Name": [None, None, None, "Non Null", None, "Name", "Jane", "Bob"],
+        "Age": [None, None, None, None, None, "Age", 30, 35],
+        "City": [None, None, None, None, None, "City", "LA", "Chicago"],
+    },
+    strict=False,
+)
+
+
+def _xlsx(df: pl.DataFrame, **write_kwargs) -> io.BytesIO:
+    """Writes the dataframe to an in-memory workbook, avoiding a temp file round-trip"""
+    buffer = io.BytesIO()
+    df.write_excel(buffer, **write_kwargs)
+    buffer.seek(0)
+    return buffer
+
+
+@pytest.mark.parametrize(
+    "df,write_kwargs,expected_keywords,expected",
+    [
+        pytest.param(HEADERS_AT_TOP, {}, None, 0, id="at_beginning"),
+        pytest.param(
+            OFFSET_HEADERS,
+            {"include_header": False, "position": (2, 0)},
+            None,
+            4,
+            id="offset_headers",
+        ),
+        pytest.param(
+            OFFSET_HEADERS_WITH_BLANK_ROWS,
+            {"include_header": False},
+            None,
+            5,
+            id="offset_headers_and_blank_row_at_top",
+        ),
+        pytest.param(
+            OFFSET_HEADERS_WITH_BLANK_ROWS,
+            {"include_header": False},
+            ["non null"],
+            3,
+            id="expected_keywords",
+        ),
+    ],
+)
+def test_locate_header_row(df, write_kwargs, expected_keywords, expected):
+    buffer = _xlsx(df, **write_kwargs)
+    assert locate_header_row(buffer, expected_keywords=expected_keywords) == expected
+
+
+def test_locate_header_row_with_sheet_id():
+    first = pl.DataFrame({"Name": ["John"], "Age": [25]})
+    second = pl.DataFrame(
         {
-            "Name": ["John", "Jane", "Bob"],
-            "Age": [25, 30, 35],
-            "City": ["NYC", "LA", "Chicago"],
-        }
+            "Name": ["Non Null", None, "Name", "Jane"],
+            "Age": [None, None, "Age", 30],
+        },
+        strict=False,
     )
+    buffer = io.BytesIO()
+    with Workbook(buffer) as wb:
+        first.write_excel(wb, worksheet="first")
+        second.write_excel(wb, worksheet="second", include_header=False)
 
-    with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as tmp:
-        df.write_excel(tmp.name)
-        result = locate_header_row(tmp.name)
-        assert result == 0
-
-    os.unlink(tmp.name)
+    assert locate_header_row(buffer, sheet_id=0) == 0
+    assert locate_header_row(buffer, sheet_id=1) == 2
 
 
-def test_locate_header_row_with_offset_headers():
+def test_locate_header_row_keywords_on_narrower_row():
     df = pl.DataFrame(
         {
-            "Name": ["Non Null", None, "Name", "Jane", "Bob"],
-            "Age": [None, None, "Age", 30, 35],
-            "City": [None, None, "City", "LA", "Chicago"],
+            "Name": ["Report", None, "Name", "Jane"],
+            "Age": ["Generated", None, "Age", 30],
+            "City": ["Today", None, None, "LA"],
         },
         strict=False,
     )
-    with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as tmp:
-        df.write_excel(tmp.name, include_header=False, position=(2, 0))
-        result = locate_header_row(tmp.name)
-        assert result == 4
+    result = locate_header_row(
+        _xlsx(df, include_header=False), expected_keywords=["name", "age"]
+    )
+    assert result == 2
 
-    os.unlink(tmp.name)
 
+def test_locate_header_row_counts_zero_values():
+    """Numeric zero cells are values, not empty cells"""
+    wb = OpenpyxlWorkbook()
+    ws = wb.active
+    ws.append(["Aging report"])
+    ws.append([])
+    ws.append([0, 30, 60, 90])
+    ws.append([100, 200, 300, 400])
 
-def test_locate_header_row_with_offset_headers_and_blank_row_at_top():
-    df = pl.DataFrame(
+    buffer = io.BytesIO()
+    wb.save(buffer)
+    assert locate_header_row(buffer) == 2
+
+
+def test_locate_header_rows():
+    at_top = pl.DataFrame({"Name": ["John"], "Age": [25]})
+    offset = pl.DataFrame(
         {
-            "Name": [None, None, None, "Non Null", None, "Name", "Jane", "Bob"],
-            "Age": [None, None, None, None, None, "Age", 30, 35],
-            "City": [None, None, None, None, None, "City", "LA", "Chicago"],
+            "Name": ["Non Null", None, "Name", "Jane"],
+            "Age": [None, None, "Age", 30],
         },
         strict=False,
     )
-    with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as tmp:
-        df.write_excel(tmp.name, include_header=False)
-        result = locate_header_row(tmp.name)
-        assert result == 5
+    # Each thread needs its own buffer, a file-like object must not be shared between threads
+    buffers = [_xlsx(at_top), _xlsx(offset, include_header=False), _xlsx(at_top)]
 
-    os.unlink(tmp.name)
+    result = locate_header_rows(buffers, max_workers=2)
+    assert result == [0, 2, 0]
 
 
-def test_locate_header_row_with_expected_keywords():
-    df = pl.DataFrame(
+@pytest.fixture
+def clear_cache():
+    """Clears the header row cache even if the test fails, so no cached state leaks into other tests"""
+    yield
+    clear_header_row_cache()
+
+
+def test_locate_header_row_rescans_modified_file(tmp_path, clear_cache):
+    at_top = pl.DataFrame({"Name": ["John"], "Age": [25]})
+    offset = pl.DataFrame(
         {
-            "Name": [None, None, None, "Non Null", None, "Name", "Jane", "Bob"],
-            "Age": [None, None, None, None, None, "Age", 30, 35],
-            "City": [None, None, None, None, None, "City", "LA", "Chicago"],
+            "Name": ["Non Null", None, "Name", "Jane"],
+            "Age": [None, None, "Age", 30],
         },
         strict=False,
     )
-    with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as tmp:
-        df.write_excel(tmp.name, include_header=False)
-        result = locate_header_row(tmp.name, expected_keywords=["non null"])
-        assert result == 3
+    clear_header_row_cache()
+    path = tmp_path / "sheet.xlsx"
+    at_top.write_excel(path)
+    assert locate_header_row(path) == 0
+    assert locate_header_row(path) == 0
+    # The unchanged file is scanned once, the second call is served from the cache
+    assert _locate_header_row_in_file.cache_info().misses == 1
+    assert _locate_header_row_in_file.cache_info().hits == 1
+
+    offset.write_excel(path, include_header=False)
+    assert locate_header_row(path) == 2
+    assert _locate_header_row_in_file.cache_info().misses == 2
+
+
+def test_locate_header_row_path_with_empty_keywords(tmp_path, clear_cache):
+    path = tmp_path / "sheet.xlsx"
+    OFFSET_HEADERS.write_excel(path, include_header=False, position=(2, 0))
 
-    os.unlink(tmp.name)
+    assert locate_header_row(path, expected_keywords=[]) == 4
+    assert locate_header_rows([path], expected_keywords=[]) == [4]
@@ -0,0 +1,27 @@
+import io
+
+from openpyxl import Workbook
+
+from rpatoolkit.xl import read_multiple_sheets
+
+
+def test_read_multiple_sheets_finds_header_row_per_sheet():
+    wb = Workbook()
+    first = wb.active
+    first.title = "First"
+    first.append(["Name", "Age"])
+    first.append(["John", 25])
+
+    second = wb.create_sheet("Second")
+    second.append(["Report"])
+    second.append([])
+    second.append(["City", "Country"])
+    second.append(["Paris", "France"])
+
+    buffer = io.BytesIO()
+    wb.save(buffer)
+
+    result = read_multiple_sheets(buffer, find_header_row=True)
+    assert result["first"].columns == ["name", "age"]
+    assert result["second"].columns == ["city", "country"]
+    assert result["second"].rows() == [("Paris", "France")]
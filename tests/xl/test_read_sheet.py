@@ -0,0 +1,110 @@
+import io
+
+import pytest
+from openpyxl import Workbook
+
+from rpatoolkit.xl import read_sheet
+
+
+def _xlsx(wb: Workbook) -> io.BytesIO:
+    buffer = io.BytesIO()
+    wb.save(buffer)
+    buffer.seek(0)
+    return buffer
+
+
+@pytest.fixture
+def sheet_with_empty_columns() -> io.BytesIO:
+    """A sheet with a named empty column ('Empty') and a headerless empty column (B)"""
+    wb = Workbook()
+    ws = wb.active
+    ws.append(["Name", None, "Empty", "Age"])
+    ws.append(["John", None, None, 25])
+    ws.append(["Jane", None, None, 30])
+    return _xlsx(wb)
+
+
+@pytest.mark.parametrize("visible_rows_only", [False, True])
+def test_read_sheet_drop_empty_cols_keeps_named_columns(
+    sheet_with_empty_columns, visible_rows_only
+):
+    df = read_sheet(sheet_with_empty_columns, visible_rows_only=visible_rows_only)
+    assert df.columns == ["name", "empty", "age"]
+    assert df["empty"].null_count() == df.height
+
+
+def test_read_sheet_visible_rows_keeps_empty_cols_when_disabled(
+    sheet_with_empty_columns,
+):
+    df = read_sheet(
+        sheet_with_empty_columns, visible_rows_only=True, drop_empty_cols=False
+    )
+    assert df.columns == ["name", "column_1", "empty", "age"]
+
+
+@pytest.fixture
+def people_sheet() -> io.BytesIO:
+    wb = Workbook()
+    ws = wb.active
+    ws.append(["Name", "Age", "City"])
+    ws.append(["John", 25, "NYC"])
+    ws.append(["Jane", 30, "LA"])
+    return _xlsx(wb)
+
+
+@pytest.mark.parametrize("visible_rows_only", [False, True])
+@pytest.mark.parametrize(
+    "columns,expected",
+    [
+        pytest.param([2, 0], ["city", "name"], id="indices"),
+        pytest.param("Age", ["age"], id="name"),
+        pytest.param(["City", "Name"], ["city", "name"], id="names"),
+        pytest.param([], ["name", "age", "city"], id="empty"),
+    ],
+)
+def test_read_sheet_columns(people_sheet, visible_rows_only, columns, expected):
+    df = read_sheet(people_sheet, columns=columns, visible_rows_only=visible_rows_only)
+    assert df.columns == expected
+    assert df.height == 2
+
+
+@pytest.mark.parametrize("visible_rows_only", [False, True])
+def test_read_sheet_columns_mixed_raises(people_sheet, visible_rows_only):
+    with pytest.raises(TypeError, match="all indices or all names"):
+        read_sheet(
+            people_sheet, columns=[0, "Age"], visible_rows_only=visible_rows_only
+        )
+
+
+def test_read_sheet_finds_header_row_of_first_visible_sheet():
+    wb = Workbook()
+    hidden = wb.active
+    hidden.title = "hidden"
+    hidden.sheet_state = "hidden"
+    hidden.append(["Id", "Value"])
+    hidden.append([1, 2])
+
+    visible = wb.create_sheet("visible")
+    visible.append(["Report"])
+    visible.append([])
+    visible.append(["Name", "Age"])
+    visible.append(["Jane", 30])
+
+    df = read_sheet(_xlsx(wb), first_visbile_sheet=True, find_header_row=True)
+    assert df.columns == ["name", "age"]
+    assert df.rows() == [("Jane", 30)]
+
+
+@pytest.mark.parametrize("visible_rows_only", [False, True])
+def test_read_sheet_drop_empty_cols_keeps_named_column_like_generated_name(
+    visible_rows_only,
+):
+    """A real 'column_1' header must not be mistaken for a generated one"""
+    wb = Workbook()
+    ws = wb.active
+    ws.append(["Name", "column_1", "Age"])
+    ws.append(["John", None, 25])
+    ws.append(["Jane", None, 30])
+
+    df = read_sheet(_xlsx(wb), visible_rows_only=visible_rows_only)
+    assert df.columns == ["name", "column_1", "age"]
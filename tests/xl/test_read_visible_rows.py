@@ -0,0 +1,47 @@
+import os
+import tempfile
+
+from openpyxl import Workbook
+
+from rpatoolkit.xl import read_visible_rows
+
+
+def test_read_visible_rows_skips_hidden_rows():
+    wb = Workbook()
+    ws = wb.active
+    for row in [["Name", "Age"], ["John", 25], ["Hidden", 99], ["  Jane  ", 30]]:
+        ws.append(row)
+    ws.row_dimensions[3].hidden = True
+
+    with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as tmp:
+        wb.save(tmp.name)
+        df = read_visible_rows(tmp.name)
+
+    os.unlink(tmp.name)
+
+    assert df.columns == ["Name", "Age"]
+    assert df["Name"].to_list() == ["John", "Jane"]
+    assert df["Age"].to_list() == [25, 30]
+
+
+def test_read_visible_rows_drops_empty_rows():
+    wb = Workbook()
+    ws = wb.active
+    for row in [
+        ["Name", "Age"],
+        ["John", 25],
+        [None, None],
+        ["   ", None],
+        ["Jane", 0],
+    ]:
+        ws.append(row)
+
+    with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as tmp:
+        wb.save(tmp.name)
+        df = read_visible_rows(tmp.name)
+        unstripped_df = read_visible_rows(tmp.name, strip_values=False)
+
+    os.unlink(tmp.name)
+
+    assert df["Name"].to_list() == ["John", "Jane"]
+    assert unstripped_df["Name"].to_list() == ["John", "Jane"]